@@ -1,10 +1,8 @@
-import argparse, json
+import argparse, sys
+import orjson
 from uuid import UUID
 from datetime import date
-from .db import (
-    fetch_unit_core, fetch_active_leases, fetch_latest_permit_for_building,
-    fetch_latest_title, fetch_unit_meters, fetch_readings
-)
+from .db import fetch_unit_bundle
 from .models import building_age_years, TitleRecord
 from .features import (
     rent_roll_total, noi, occupancy_rate, days_since_last_occupancy,
@@ -12,22 +10,24 @@ from .features import (
     ltv, cap_rate, value_from_cap
 )
 
+def _positive_float(s: str) -> float:
+    v = float(s)
+    if not v > 0:  # also rejects nan
+        raise argparse.ArgumentTypeError(f"must be > 0, got {s}")
+    return v
+
 def main():
     ap = argparse.ArgumentParser(description="PropTech demo CLI")
     ap.add_argument("--unit-id", required=True, type=UUID, help="Unit UUID")
     ap.add_argument("--days-back", type=int, default=7)
-    ap.add_argument("--assumed-cap-rate", type=float, default=0.06)
+    ap.add_argument("--assumed-cap-rate", type=_positive_float, default=0.06)
     ap.add_argument("--loan-balance", type=float, default=0.0)
     args = ap.parse_args()
 
-    # Load chain
-    u, b, p = fetch_unit_core(args.unit_id)
-    leases = fetch_active_leases(u.id)
-    permit = fetch_latest_permit_for_building(b.id)
-    title = fetch_latest_title(u.id, p.id)
-    meters = fetch_unit_meters(u.id)
-    elec = next((m for m in meters if m.type == "electricity"), None)
-    readings = fetch_readings(elec.id, days_back=args.days_back) if elec else []
+    # Load chain (single round trip)
+    bundle = fetch_unit_bundle(args.unit_id, days_back=args.days_back)
+    u, b, p = bundle["unit"], bundle["building"], bundle["parcel"]
+    leases, permit, title = bundle["leases"], bundle["permit"], bundle["title"]
 
     # Trivial metrics
     monthly_rent = rent_roll_total(leases)
@@ -38,12 +38,8 @@ def main():
     days_since_occ = days_since_last_occupancy(permit)
     title_ok = title_clean_flag_from_record(title)
 
-    # Energy intensity (kWh/m²/day) from readings
-    by_day = {}
-    for r in readings:
-        d = r.ts.date()
-        by_day[d] = by_day.get(d, 0.0) + r.value
-    intensity = kwh_per_m2_day_from_series(u, list(by_day.values())) if by_day else 0.0
+    # Energy intensity (kWh/m²/day) from per-day totals
+    intensity = kwh_per_m2_day_from_series(u, bundle["daily_kwh"])
 
     out = {
         "parcel": {"zoning": p.zoning, "muni_id": p.muni_id},
@@ -59,10 +55,12 @@ def main():
         "compliance": {"days_since_occupancy": days_since_occ, "title_clean": title_ok},
         "energy": {"kwh_per_m2_day": intensity, "window_days": args.days_back},
         # TODO Inference hooks: AVM, PD/LGD, CPR/CDR, rent recommendations, etc.
-        "_meta": {"generated_on": date.today().isoformat()}
+        "_meta": {"generated_on": date.today()}
     }
 
-    print(json.dumps(out, ensure_ascii=False, indent=2))
+    sys.stdout.buffer.write(orjson.dumps(
+        out, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+    ))
 
 if __name__ == "__main__":
     main()
@@ -3,11 +3,18 @@
 # Append below your existing dataclasses & helpers
 # ============================================================
 
+from collections import defaultdict
 from datetime import date
 from typing import Iterable, Tuple, Dict, List, Optional
 import math
 import statistics as stats
 
+from .models import (
+    Unit, Building, Parcel, Lease, Permit, TitleRecord, title_clean_flag_from_record
+)
+
+_ACTIVE = "active"  # Lease.status of a live lease
+
 # ------------------------------------------------------------
 # 1) Valuation & investment metrics
 # ------------------------------------------------------------
@@ -105,15 +112,20 @@ def weighted_average_life(schedule: Iterable[Tuple[date, float]]) -> float:
 # ------------------------------------------------------------
 
 def rent_roll_total(active_leases: Iterable[Lease]) -> float:
-    """Sum of monthly rent for active leases"""
-    return sum(l.rent_monthly for l in active_leases if l.status == "active")
+    """Sum of monthly rent; caller passes active leases only (e.g. from fetch_active_leases)"""
+    return math.fsum(l.rent_monthly for l in active_leases)
+
+def rent_roll_total_filter_status(leases: Iterable[Lease]) -> float:
+    """Sum of monthly rent over the active leases in a mixed-status list"""
+    return rent_roll_total(l for l in leases if l.status == _ACTIVE)
 
 def occupancy_rate(units: Iterable[Unit], leases: Iterable[Lease]) -> float:
     """Occupancy = active leased units / total units (unit considered occupied if any active lease)"""
-    unit_ids = {u.id for u in units}
-    occupied = {l.unit_id for l in leases if l.status == "active"}
-    denom = len(unit_ids)
-    return 0.0 if denom == 0 else len(unit_ids & occupied) / denom
+    occupied = {l.unit_id for l in leases if l.status == _ACTIVE}
+    unit_list = list(units)
+    denom = len(unit_list)
+    hit = sum(1 for u in unit_list if u.id in occupied)
+    return 0.0 if denom == 0 else hit / denom
 
 def avg_time_to_lease(days_vacant_list: Iterable[int]) -> float:
     """Average days-to-lease from historical records"""
@@ -157,11 +169,7 @@ def days_since_last_occupancy(perm: Optional[Permit]) -> Optional[int]:
         return None
     return (date.today() - perm.completed_on).days
 
-def title_clean_flag_from_record(t: Optional[TitleRecord]) -> bool:
-    """True if lien_status in {free, released}"""
-    if t is None:
-        return False
-    return t.encumbrance.get("lien_status", "").lower() in {"free", "released"}
+# title_clean_flag_from_record: defined in models (reads the precomputed TitleRecord.clean)
 
 def zoning_mismatch(actual_use: str, zoning_code: str, allowed_map: Dict[str, List[str]]) -> bool:
     """True if actual use not allowed by zoning (simple lookup)"""
@@ -297,10 +305,10 @@ def cohort_churn_rate(ended_leases_in_cohort: int, cohort_size: int) -> float:
 
 def exposure_by_bucket(values_by_bucket: Iterable[Tuple[str, float]]) -> Dict[str, float]:
     """Aggregate value by bucket (e.g., region/segment)"""
-    agg: Dict[str, float] = {}
+    agg: Dict[str, float] = defaultdict(float)
     for bucket, v in values_by_bucket:
-        agg[bucket] = agg.get(bucket, 0.0) + v
-    return agg
+        agg[bucket] += v
+    return dict(agg)
 
 def weighted_yield(weights_and_yields: Iterable[Tuple[float, float]]) -> float:
     """Sum(w_i * y_i) where weights sum to 1 (not enforced here)"""
@@ -356,11 +364,11 @@ def los_package_dict(
     avm_value: Optional[float],
     valuation_date: Optional[date]
 ) -> Dict[str, object]:
-    """Minimal LOS/underwriting export as a dict (serialize to JSON as needed)"""
+    """Minimal LOS/underwriting export as a dict (UUID/date values left native; serialize with orjson)"""
     return {
-        "parcel": {"id": str(p.id), "muni_id": p.muni_id, "zoning": p.zoning},
-        "building": {"id": str(b.id), "year_built": b.year_built, "floors": b.floors, "bua_m2": b.bua_m2},
-        "unit": {"id": str(u.id), "use_type": u.use_type, "nla_m2": u.nla_m2, "floor_no": u.floor_no},
+        "parcel": {"id": p.id, "muni_id": p.muni_id, "zoning": p.zoning},
+        "building": {"id": b.id, "year_built": b.year_built, "floors": b.floors, "bua_m2": b.bua_m2},
+        "unit": {"id": u.id, "use_type": u.use_type, "nla_m2": u.nla_m2, "floor_no": u.floor_no},
         "title": {
             "present": latest_title is not None,
             "deed_no": (latest_title.deed_no if latest_title else None),
@@ -371,7 +379,7 @@ def los_package_dict(
             "completed_on": (latest_permit.completed_on if latest_permit else None),
         },
         "valuation": {"avm_value": avm_value, "valuation_date": valuation_date},
-        "generated_on": date.today().isoformat()
+        "generated_on": date.today()
     }
 
 # TODO Inference: data-minimization/redaction by recipient role, anomaly-aware highlighting,
@@ -1,19 +1,21 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, Literal, Dict
 from datetime import date, datetime
 from uuid import UUID
 
+_CLEAN_SET = frozenset({"free", "released"})  # lien statuses that count as a clean title
+
 # --------- Core dataclasses ---------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Parcel:
     id: UUID
     muni_id: str
     zoning: str
     geom_wkt: str  # polygon in WKT (EPSG:4326)
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Building:
     id: UUID
     parcel_id: UUID
@@ -22,7 +24,7 @@ class Building:
     floors: int
     bua_m2: float
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Unit:
     id: UUID
     building_id: UUID
@@ -32,7 +34,7 @@ class Unit:
     bedrooms: Optional[int] = None
     orientation: Optional[str] = None
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Lease:
     id: UUID
     unit_id: UUID
@@ -43,7 +45,7 @@ class Lease:
     deposit: float
     status: Literal["planned", "active", "expired", "defaulted"]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Meter:
     id: UUID
     scope: Literal["building", "unit"]
@@ -51,13 +53,13 @@ class Meter:
     type: str
     provider_acct: Optional[str] = None
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MeterReading:
     meter_id: UUID
     ts: datetime
     value: float
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Permit:
     id: UUID
     scope: Literal["parcel","building","unit"]
@@ -68,7 +70,7 @@ class Permit:
     completed_on: Optional[date]
     permit_no: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TitleRecord:
     id: UUID
     scope: Literal["parcel","unit"]
@@ -77,6 +79,12 @@ class TitleRecord:
     deed_no: str
     encumbrance: Dict[str, str]
     effective_on: date
+    clean: bool = field(init=False)  # lien_status in {free, released}; derived from encumbrance
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "clean", (self.encumbrance.get("lien_status") or "").lower() in _CLEAN_SET
+        )
 
 # --------- Low-level helpers (used by CLI/examples) ---------
 
@@ -85,6 +93,5 @@ def building_age_years(b: Building, asof: date | None = None) -> int:
     return max(0, asof.year - int(b.year_built))
 
 def title_clean_flag_from_record(t: TitleRecord | None) -> bool:
-    if t is None:
-        return False
-    return t.encumbrance.get("lien_status", "").lower() in {"free", "released"}
+    """True if lien_status in {free, released} (TitleRecord.clean, derived at construction)"""
+    return t is not None and t.clean
@@ -0,0 +1,23 @@
+-- Indexes behind the db.py fetchers / v_unit_bundle(), for databases created before
+-- they were added to schema.sql. CONCURRENTLY avoids blocking writes while building,
+-- so run this file outside a transaction block:
+--   psql "$DATABASE_URL" -f sql/migrations/001_fetcher_indexes.sql
+--
+-- A CONCURRENTLY build that fails (deadlock, cancel, lock timeout) leaves an INVALID
+-- index behind, and a re-run's IF NOT EXISTS silently skips it. Check with
+--   SELECT indexrelid::regclass FROM pg_index WHERE NOT indisvalid;
+-- and DROP INDEX CONCURRENTLY any listed here before re-running.
+
+-- fetch_active_leases: active leases of a unit, newest first
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_lease_unit_active
+  ON lease(unit_id, start_date DESC) WHERE status = 'active';
+
+-- fetch_latest_permit_for_building: the partial predicate pins scope/kind, so keys follow
+-- the ORDER BY directly and ORDER BY ... LIMIT 1 reads the first matching index entry
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_permit_bldg_occ
+  ON permit(scope_id, completed_on DESC NULLS LAST, issued_on DESC NULLS LAST)
+  WHERE scope = 'building' AND kind IN ('occupancy','completion');
+
+-- fetch_latest_title: newest unit- or parcel-scope title
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_title_scope_latest
+  ON title_record(scope, scope_id, effective_on DESC);
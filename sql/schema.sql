@@ -73,6 +73,16 @@ CREATE TABLE IF NOT EXISTS title_record(
   effective_on DATE
 );
 
+-- Indexes for the loader's lookups (sql/migrations/001_fetcher_indexes.sql adds them to live DBs)
+-- meter_reading needs none: its PK (meter_id, ts) already serves meter + time-window scans.
+CREATE INDEX IF NOT EXISTS ix_lease_unit_active
+  ON lease(unit_id, start_date DESC) WHERE status = 'active';
+CREATE INDEX IF NOT EXISTS ix_permit_bldg_occ
+  ON permit(scope_id, completed_on DESC NULLS LAST, issued_on DESC NULLS LAST)
+  WHERE scope = 'building' AND kind IN ('occupancy','completion');
+CREATE INDEX IF NOT EXISTS ix_title_scope_latest
+  ON title_record(scope, scope_id, effective_on DESC);
+
 -- View to pull a “unit chain”
 CREATE OR REPLACE VIEW v_unit_core AS
 SELECT
@@ -94,3 +104,58 @@ SELECT
 FROM unit u
 JOIN building b ON b.id = u.building_id
 JOIN parcel   p ON p.id = b.parcel_id;
+
+-- Whole CLI load (unit chain + leases + permit + title + daily kWh) as one JSONB document;
+-- readings of the unit's `meter_type` meters are summed per day server-side,
+-- so one number per day crosses the wire
+DROP FUNCTION IF EXISTS v_unit_bundle(UUID, INT);
+CREATE OR REPLACE FUNCTION v_unit_bundle(uid UUID, days_back INT, meter_type TEXT DEFAULT 'electricity')
+RETURNS JSONB
+LANGUAGE sql STABLE AS $$
+  WITH core AS (
+    SELECT * FROM v_unit_core WHERE unit_id = uid
+  ),
+  leases AS (
+    SELECT l.* FROM lease l
+    WHERE l.unit_id = uid AND l.status = 'active'
+  ),
+  permit AS (
+    SELECT pm.* FROM permit pm, core c
+    WHERE pm.scope = 'building' AND pm.scope_id = c.building_id
+      AND pm.kind IN ('occupancy','completion')
+    ORDER BY pm.completed_on DESC NULLS LAST, pm.issued_on DESC NULLS LAST
+    LIMIT 1
+  ),
+  title AS (
+    -- latest unit-scope title, else the parcel's; each branch is one index probe
+    SELECT * FROM (
+      (SELECT t.*, 0 AS pri FROM title_record t
+       WHERE t.scope = 'unit' AND t.scope_id = uid
+       ORDER BY t.effective_on DESC LIMIT 1)
+      UNION ALL
+      (SELECT t.*, 1 AS pri FROM title_record t, core c
+       WHERE t.scope = 'parcel' AND t.scope_id = c.parcel_id
+       ORDER BY t.effective_on DESC LIMIT 1)
+    ) x
+    ORDER BY pri LIMIT 1
+  ),
+  meters AS (
+    SELECT m.* FROM meter m
+    WHERE m.scope = 'unit' AND m.scope_id = uid AND m.type = meter_type
+  ),
+  daily AS (
+    SELECT r.ts::date AS day, SUM(r.value) AS kwh
+    FROM meter_reading r
+    JOIN meters m ON m.id = r.meter_id
+    WHERE r.ts >= now() - make_interval(days => days_back)
+    GROUP BY 1
+  )
+  SELECT jsonb_build_object(
+    'unit',     to_jsonb(c),
+    'leases',   COALESCE((SELECT jsonb_agg(to_jsonb(l) ORDER BY l.start_date DESC) FROM leases l), '[]'::jsonb),
+    'permit',   (SELECT to_jsonb(pm) FROM permit pm),
+    'title',    (SELECT to_jsonb(t) FROM title t),
+    'daily_kwh', COALESCE((SELECT jsonb_agg(d.kwh ORDER BY d.day) FROM daily d), '[]'::jsonb)
+  )
+  FROM core c;
+$$;